@@ -9,6 +9,7 @@ This script enables clipboard sync between Android and Linux over LAN
 
 المتطلبات / Requirements:
     pip install pyperclip zeroconf
+    pip install python-xlib  # اختياري / optional (X11 clipboard events)
 
 الاستخدام / Usage:
     python3 nexusclip_daemon.py
@@ -20,17 +21,24 @@ This script enables clipboard sync between Android and Linux over LAN
 الإصدار / Version: 1.0.0
 """
 
+import asyncio
+import ctypes
+import errno
+import heapq
 import socket
-import threading
 import time
-import base64
 import json
+import os
+import platform
 import signal
 import sys
 import argparse
-from typing import Optional, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, List, Set, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+
+# يُحمّل الامتداد المترجم بـ mypyc إن وُجد / Loads the mypyc-compiled extension when built
+from nexusclip_parse import split_header, parse_device, decode_clipboard, encode_clipboard
 
 try:
     import pyperclip
@@ -41,11 +49,20 @@ except ImportError:
 
 try:
     from zeroconf import ServiceInfo, Zeroconf, ServiceBrowser, ServiceListener
+    from zeroconf.asyncio import AsyncZeroconf
 except ImportError:
     print("⚠️ zeroconf غير مثبت / zeroconf not installed")
     print("   التثبيت / Install: pip install zeroconf")
     print("   سيتم استخدام البث المباشر فقط / Will use direct broadcast only")
     Zeroconf = None
+    AsyncZeroconf = None
+
+try:
+    from Xlib import X, display as xdisplay
+    from Xlib.ext import xfixes
+except ImportError:
+    # الاستطلاع عبر pyperclip كبديل / Fall back to pyperclip polling
+    xdisplay = None
 
 # =====================================================
 # ثوابت / Constants
@@ -53,6 +70,7 @@ except ImportError:
 
 SYNC_PORT = 4040
 BUFFER_SIZE = 65535
+MAX_DATAGRAM_SIZE = 65507  # أقصى حمولة UDP عبر IPv4 / Max UDP payload over IPv4
 DISCOVERY_MESSAGE = "NEXUSCLIP_DISCOVER"
 CLIPBOARD_PREFIX = "NEXUSCLIP_CLIP:"
 ACK_PREFIX = "NEXUSCLIP_ACK:"
@@ -60,32 +78,267 @@ DEVICE_PREFIX = "NEXUSCLIP_DEVICE:"
 HEARTBEAT_MESSAGE = "NEXUSCLIP_HEARTBEAT"
 MDNS_TYPE = "_nexusclip._udp.local."
 
+# رسائل مُرمّزة مسبقاً / Pre-encoded wire messages
+CLIPBOARD_PREFIX_BYTES = CLIPBOARD_PREFIX.encode('utf-8')
+ACK_RECEIVED_BYTES = f"{ACK_PREFIX}RECEIVED".encode('utf-8')
+HEARTBEAT_BYTES = HEARTBEAT_MESSAGE.encode('utf-8')
+
+# رؤوس الرسائل قبل ':' لجدول التوجيه / Message headers (before ':') for dispatch
+DISCOVERY_HEADER = DISCOVERY_MESSAGE.encode('utf-8')
+DEVICE_HEADER = DEVICE_PREFIX[:-1].encode('utf-8')
+CLIPBOARD_HEADER = CLIPBOARD_PREFIX[:-1].encode('utf-8')
+ACK_HEADER = ACK_PREFIX[:-1].encode('utf-8')
+HEARTBEAT_HEADER = HEARTBEAT_BYTES
+RECV_BATCH_SIZE = 32
+STALE_TIMEOUT = 120  # ثانية / seconds
+STALE_TIMEOUT_NS = STALE_TIMEOUT * 1_000_000_000
+BROADCAST_DEBOUNCE = 0.2  # ثانية / seconds
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024  # يحدّه net.core.rmem_max/wmem_max / capped by sysctl
+
+# تعطيل الألوان عند توجيه المخرجات لملف / No colors when output is redirected
+_TTY = sys.stdout.isatty()
+
 # ألوان الطرفية / Terminal Colors
 class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    END = '\033[0m'
-    BOLD = '\033[1m'
+    HEADER = '\033[95m' if _TTY else ''
+    BLUE = '\033[94m' if _TTY else ''
+    CYAN = '\033[96m' if _TTY else ''
+    GREEN = '\033[92m' if _TTY else ''
+    WARNING = '\033[93m' if _TTY else ''
+    FAIL = '\033[91m' if _TTY else ''
+    END = '\033[0m' if _TTY else ''
+    BOLD = '\033[1m' if _TTY else ''
+
+_BANNER = f"""
+{Colors.HEADER}╔══════════════════════════════════════════════════════════╗
+║                                                          ║
+║   {Colors.CYAN}███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗{Colors.HEADER}            ║
+║   {Colors.CYAN}████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝{Colors.HEADER}            ║
+║   {Colors.CYAN}██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗{Colors.HEADER}            ║
+║   {Colors.CYAN}██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║{Colors.HEADER}            ║
+║   {Colors.CYAN}██║ ╚████║███████╗██╔╝ ██╗╚██████╔╝███████║{Colors.HEADER}            ║
+║   {Colors.CYAN}╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚══════╝{Colors.HEADER}            ║
+║                                                          ║
+║   {Colors.GREEN}NexusClip Linux Companion v1.0{Colors.HEADER}                        ║
+║   {Colors.BLUE}نظام مزامنة الحافظة / Clipboard Sync System{Colors.HEADER}            ║
+║                                                          ║
+╚══════════════════════════════════════════════════════════╝{Colors.END}
+"""
 
 # =====================================================
 # نموذج الجهاز / Device Model
 # =====================================================
 
-@dataclass
+@dataclass(eq=False, repr=False)
 class Device:
     """نموذج الجهاز المكتشف / Discovered Device Model"""
+    # بدون __dict__ لكل جهاز (slots=True يتطلب Python 3.10)
+    # No per-instance __dict__ (slots=True needs Python 3.10)
+    __slots__ = ('address', 'platform', 'name', 'last_seen')
+    
     address: str
     platform: str
     name: str
-    last_seen: datetime
+    last_seen: int  # time.monotonic_ns()
     
     def __str__(self):
         return f"{self.name} ({self.platform}) - {self.address}"
 
+# =====================================================
+# استقبال دفعي / Batched Receive (Linux recvmmsg)
+# =====================================================
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ('sin_family', ctypes.c_ushort),
+        ('sin_port', ctypes.c_uint16),
+        ('sin_addr', ctypes.c_ubyte * 4),
+        ('sin_zero', ctypes.c_ubyte * 8),
+    ]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IoVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _MsgHdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+def _load_recvmmsg():
+    """تحميل recvmmsg من libc / Load recvmmsg from libc (Linux only)"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        func = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+        ctypes.c_int, ctypes.c_void_p,
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+_recvmmsg = _load_recvmmsg()
+
+class _RecvBatch:
+    """
+    مخازن مُعدة مسبقاً لـ recvmmsg
+    Buffers preallocated once for recvmmsg
+    """
+    
+    def __init__(self, count: int = RECV_BATCH_SIZE, size: int = BUFFER_SIZE):
+        self.count = count
+        self.bufs = [bytearray(size) for _ in range(count)]
+        self.views = [memoryview(buf) for buf in self.bufs]
+        self.iovecs = (_IoVec * count)()
+        self.addrs = (_SockAddrIn * count)()
+        self.mmsgs = (_MMsgHdr * count)()
+        
+        for i, buf in enumerate(self.bufs):
+            c_buf = (ctypes.c_char * size).from_buffer(buf)
+            self.iovecs[i].iov_base = ctypes.addressof(c_buf)
+            self.iovecs[i].iov_len = size
+            hdr = self.mmsgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(self.addrs[i])
+            hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            hdr.msg_iovlen = 1
+
+def _recvmmsg_batch(sock_fd: int, batch: _RecvBatch) -> List[Tuple[bytes, str]]:
+    """
+    قراءة حتى RECV_BATCH_SIZE رسالة باستدعاء نظام واحد
+    Drain up to RECV_BATCH_SIZE datagrams with a single syscall
+    """
+    for mmsg in batch.mmsgs:
+        mmsg.msg_hdr.msg_namelen = ctypes.sizeof(_SockAddrIn)
+    
+    received = _recvmmsg(sock_fd, batch.mmsgs, batch.count, socket.MSG_DONTWAIT, None)
+    if received < 0:
+        err = ctypes.get_errno()
+        if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+            return []
+        raise OSError(err, os.strerror(err))
+    
+    return [
+        (
+            bytes(batch.views[i][:batch.mmsgs[i].msg_len]),
+            socket.inet_ntoa(bytes(batch.addrs[i].sin_addr)),
+        )
+        for i in range(received)
+    ]
+
+# =====================================================
+# مراقبة حافظة X11 / X11 Clipboard Watcher
+# =====================================================
+
+class X11ClipboardWatcher:
+    """
+    مراقبة الحافظة عبر أحداث XFixes بدلاً من الاستطلاع
+    Watches the clipboard through XFixes events instead of polling
+    """
+    
+    def __init__(self, on_change: Callable[[Optional[str]], None]):
+        self.on_change = on_change
+        self.display = xdisplay.Display()
+        
+        if not self.display.has_extension('XFIXES'):
+            self.display.close()
+            raise RuntimeError("XFIXES extension not supported")
+        self.display.xfixes_query_version()
+        
+        root = self.display.screen().root
+        self.window = root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self.clipboard_atom = self.display.get_atom('CLIPBOARD')
+        self.utf8_atom = self.display.get_atom('UTF8_STRING')
+        self.incr_atom = self.display.get_atom('INCR')
+        self.property_atom = self.display.get_atom('NEXUSCLIP_SELECTION')
+        
+        self.display.xfixes_select_selection_input(
+            root, self.clipboard_atom, xfixes.XFixesSetSelectionOwnerNotifyMask
+        )
+        self.display.flush()
+    
+    def fileno(self) -> int:
+        return self.display.fileno()
+    
+    def request_selection(self):
+        """طلب محتوى الحافظة من مالكها / Ask the owner for the clipboard"""
+        self.window.convert_selection(
+            self.clipboard_atom, self.utf8_atom, self.property_atom, X.CurrentTime
+        )
+        self.display.flush()
+    
+    def process_events(self):
+        """معالجة أحداث X المعلقة / Handle pending X events"""
+        owner_notify = self.display.extension_event.SetSelectionOwnerNotify
+        while self.display.pending_events():
+            event = self.display.next_event()
+            if (event.type, getattr(event, 'sub_code', None)) == owner_notify:
+                self.request_selection()
+            elif event.type == X.SelectionNotify and event.selection == self.clipboard_atom:
+                self._read_selection(event)
+    
+    def _read_selection(self, event):
+        """قراءة الحافظة بعد SelectionNotify / Read clipboard after SelectionNotify"""
+        if event.property == X.NONE:
+            return
+        
+        prop = self.window.get_full_property(self.property_atom, X.AnyPropertyType)
+        self.window.delete_property(self.property_atom)
+        self.display.flush()
+        if prop is None:
+            return
+        
+        # النقل التدريجي (INCR) للمحتوى الكبير / INCR transfers for large content
+        if prop.property_type == self.incr_atom:
+            self.on_change(None)
+            return
+        
+        value = prop.value
+        if isinstance(value, str):
+            self.on_change(value)
+        else:
+            self.on_change(bytes(value).decode('utf-8'))
+    
+    def close(self):
+        self.display.close()
+
+# =====================================================
+# بروتوكول UDP / UDP Protocol
+# =====================================================
+
+class NexusProtocol(asyncio.DatagramProtocol):
+    """
+    استقبال رسائل UDP داخل حلقة الأحداث
+    Receives UDP datagrams on the event loop
+    """
+    
+    def __init__(self, daemon: 'NexusClipDaemon'):
+        self.daemon = daemon
+    
+    def datagram_received(self, data: bytes, addr):
+        self.daemon._handle_datagram(data, addr[0])
+    
+    def error_received(self, exc: Exception):
+        if self.daemon.running and self.daemon.verbose:
+            print(f"{Colors.FAIL}❌ خطأ استماع: {exc}{Colors.END}")
+
 # =====================================================
 # خدمة المزامنة / Sync Service
 # =====================================================
@@ -98,61 +351,134 @@ class NexusClipDaemon:
     Manages UDP sync with Android devices
     """
     
-    def __init__(self, port: int = SYNC_PORT, verbose: bool = False):
+    def __init__(self, port: int = SYNC_PORT, verbose: bool = False, cpu: Optional[int] = None):
         self.port = port
         self.verbose = verbose
+        self.cpu = cpu
         self.running = False
         self.socket: Optional[socket.socket] = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self._recv_batch: Optional[_RecvBatch] = None
+        self._clipboard_watcher: Optional[X11ClipboardWatcher] = None
+        # عناوين هذا الجهاز لتجاهل صدى البث / This host's addresses, to drop our own broadcasts
+        self._local_addresses: Set[str] = set()
+        
+        # رد الاكتشاف ثابت طوال التشغيل / Discovery reply never changes
+        device_name = platform.node() or "Linux"
+        self._discovery_response = f"{DEVICE_PREFIX}Linux|{device_name}".encode('utf-8')
+        
+        # جدول توجيه الرسائل / Message dispatch table
+        self._dispatch: Dict[bytes, Callable[[memoryview, str], None]] = {
+            DISCOVERY_HEADER: self._respond_to_discovery,
+            DEVICE_HEADER: self._handle_device_response,
+            CLIPBOARD_HEADER: self._handle_clipboard,
+            ACK_HEADER: self._handle_ack,
+            HEARTBEAT_HEADER: self._handle_heartbeat,
+        }
         self.discovered_devices: Dict[str, Device] = {}
+        # كومة انتهاء الصلاحية (الموعد، العنوان) / Expiry heap of (deadline, address)
+        self._expiry: List[Tuple[int, str]] = []
         self.connected_device: Optional[Device] = None
+        # لا حاجة لقفل: كل الوصول يتم من حلقة الأحداث نفسها
+        # No lock needed: every access happens on the event loop thread
         self.last_clipboard = ""
-        self.clipboard_lock = threading.Lock()
+        # آخر حمولة مُرسلة (النص، base64، بايتات الرسالة) / Last sent payload (content, base64, wire bytes)
+        self._last_payload: Tuple[str, bytes, bytes] = ("", b"", b"")
+        # آخر محتوى مُرمّز بـ base64 مُرسل أو مُستلم / Last base64 payload sent or received
+        self._last_encoded_payload = b""
+        # بث مؤجل لدمج التغييرات السريعة / Deferred broadcast coalescing rapid changes
+        self._pending_broadcast: Optional[asyncio.TimerHandle] = None
+        
+        # pyperclip يستدعي xclip/xsel، لذا يُنفذ خارج حلقة الأحداث في خيط واحد
+        # يحافظ على ترتيب القراءة والكتابة
+        # pyperclip shells out to xclip/xsel, so it runs off the loop on one
+        # worker thread that keeps reads and writes in order
+        self._clipboard_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_copies = 0
+        
+        self._stop_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
         
         # Zeroconf (mDNS)
-        self.zeroconf: Optional[Zeroconf] = None
+        self.zeroconf: Optional[AsyncZeroconf] = None
         self.service_info: Optional[ServiceInfo] = None
         
-    def start(self):
-        """بدء الخدمة / Start service"""
+    async def run(self):
+        """تشغيل الخدمة حتى الإيقاف / Run service until stopped"""
+        loop = asyncio.get_running_loop()
         self.running = True
+        self._stop_event = asyncio.Event()
+        
+        # معالجة إشارات الإيقاف / Handle stop signals
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+        
+        if self.cpu is not None:
+            self._pin_to_cpu()
         
         # إنشاء UDP Socket
         self._create_socket()
+        self._local_addresses = self._detect_local_addresses()
+        if _recvmmsg:
+            # Linux: قراءة دفعية عند الجاهزية / batch-read on readiness
+            self._recv_batch = _RecvBatch()
+            loop.add_reader(self.socket.fileno(), self._on_socket_readable)
+        else:
+            self.transport, _ = await loop.create_datagram_endpoint(
+                lambda: NexusProtocol(self),
+                sock=self.socket,
+            )
         
         # تسجيل خدمة mDNS
         if Zeroconf:
-            self._register_mdns()
+            await self._register_mdns()
         
-        # بدء الخيوط / Start threads
-        threads = [
-            threading.Thread(target=self._listen_loop, daemon=True),
-            threading.Thread(target=self._clipboard_monitor_loop, daemon=True),
-            threading.Thread(target=self._heartbeat_loop, daemon=True),
-        ]
-        
-        for thread in threads:
-            thread.start()
+        # بدء المهام / Start tasks
+        self._tasks = [asyncio.create_task(self._heartbeat_loop())]
+        if not self._start_clipboard_watcher(loop):
+            self._tasks.append(asyncio.create_task(self._clipboard_monitor_loop()))
         
         self._print_banner()
         
         # الحفاظ على التشغيل / Keep running
         try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            self.stop()
+            await self._stop_event.wait()
+        finally:
+            await self._shutdown()
     
     def stop(self):
         """إيقاف الخدمة / Stop service"""
+        if not self.running:
+            return
         print(f"\n{Colors.WARNING}⏹ جاري الإيقاف... / Stopping...{Colors.END}")
         self.running = False
         
-        if self.socket:
+        if self._stop_event:
+            self._stop_event.set()
+    
+    async def _shutdown(self):
+        """تحرير الموارد / Release resources"""
+        if self._pending_broadcast:
+            self._pending_broadcast.cancel()
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._clipboard_executor.shutdown(wait=False)
+        
+        if self._clipboard_watcher:
+            asyncio.get_running_loop().remove_reader(self._clipboard_watcher.fileno())
+            self._clipboard_watcher.close()
+        
+        if self.transport:
+            self.transport.close()
+        elif self.socket:
+            asyncio.get_running_loop().remove_reader(self.socket.fileno())
             self.socket.close()
         
         if self.zeroconf:
-            self.zeroconf.unregister_service(self.service_info)
-            self.zeroconf.close()
+            await self.zeroconf.async_unregister_service(self.service_info)
+            await self.zeroconf.async_close()
         
         print(f"{Colors.GREEN}✅ تم الإيقاف بنجاح / Stopped successfully{Colors.END}")
     
@@ -161,16 +487,55 @@ class NexusClipDaemon:
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
         self.socket.bind(('0.0.0.0', self.port))
-        self.socket.settimeout(1.0)
+        self.socket.setblocking(False)
+    
+    def _pin_to_cpu(self):
+        """
+        تثبيت الخدمة على نواة معالج (Linux)
+        Pin the daemon to one CPU core (Linux)
+        
+        يُفضّل اختيار النواة التي تعالج مقاطعة بطاقة الشبكة
+        Best paired with the core handling the NIC's RX interrupt
+        """
+        try:
+            os.sched_setaffinity(0, {self.cpu})
+            if self.verbose:
+                print(f"{Colors.CYAN}📌 مثبت على المعالج / Pinned to CPU: {self.cpu}{Colors.END}")
+        except (AttributeError, OSError) as e:
+            print(f"{Colors.WARNING}⚠️ فشل التثبيت على المعالج / CPU pinning failed: {e}{Colors.END}")
     
-    def _register_mdns(self):
+    def _detect_local_addresses(self) -> Set[str]:
+        """
+        العنوان المصدر الفعلي للبث
+        Source address the kernel picks for our broadcasts
+        
+        connect() على UDP لا يرسل شيئاً، فقط يختار المسار
+        connect() on UDP sends nothing, it only resolves the route
+        """
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            probe.connect(('255.255.255.255', self.port))
+            address = probe.getsockname()[0]
+        except OSError:
+            return set()
+        finally:
+            probe.close()
+        
+        if address == '0.0.0.0' or address.startswith('127.'):
+            return set()
+        return {address}
+    
+    async def _register_mdns(self):
         """تسجيل خدمة mDNS"""
         try:
             import socket as sock
             local_ip = sock.gethostbyname(sock.gethostname())
             
-            self.zeroconf = Zeroconf()
+            self.zeroconf = AsyncZeroconf()
             self.service_info = ServiceInfo(
                 MDNS_TYPE,
                 f"NexusClip-Linux.{MDNS_TYPE}",
@@ -178,7 +543,7 @@ class NexusClipDaemon:
                 port=self.port,
                 properties={'platform': 'Linux', 'version': '1.0'},
             )
-            self.zeroconf.register_service(self.service_info)
+            await self.zeroconf.async_register_service(self.service_info)
             
             if self.verbose:
                 print(f"{Colors.CYAN}📡 mDNS مسجل / mDNS registered{Colors.END}")
@@ -186,155 +551,245 @@ class NexusClipDaemon:
             if self.verbose:
                 print(f"{Colors.WARNING}⚠️ فشل تسجيل mDNS: {e}{Colors.END}")
     
-    def _listen_loop(self):
-        """حلقة الاستماع للرسائل / Message listening loop"""
-        while self.running:
-            try:
-                data, addr = self.socket.recvfrom(BUFFER_SIZE)
-                message = data.decode('utf-8')
-                self._handle_message(message, addr[0])
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.running and self.verbose:
-                    print(f"{Colors.FAIL}❌ خطأ استماع: {e}{Colors.END}")
-    
-    def _handle_message(self, message: str, sender: str):
-        """معالجة الرسائل الواردة / Handle incoming messages"""
-        
-        # طلب اكتشاف / Discovery request
-        if message == DISCOVERY_MESSAGE:
-            self._respond_to_discovery(sender)
-            return
-        
-        # رد على الاكتشاف / Discovery response
-        if message.startswith(DEVICE_PREFIX):
-            self._handle_device_response(message, sender)
-            return
-        
-        # محتوى حافظة / Clipboard content
-        if message.startswith(CLIPBOARD_PREFIX):
-            self._handle_clipboard(message, sender)
+    def _on_socket_readable(self):
+        """قراءة دفعة من الرسائل / Drain a batch of datagrams"""
+        try:
+            datagrams = _recvmmsg_batch(self.socket.fileno(), self._recv_batch)
+        except OSError as e:
+            if self.running and self.verbose:
+                print(f"{Colors.FAIL}❌ خطأ استماع: {e}{Colors.END}")
             return
         
-        # تأكيد / Acknowledgment
-        if message.startswith(ACK_PREFIX):
-            self._handle_ack(message, sender)
+        for data, sender in datagrams:
+            self._handle_datagram(data, sender)
+    
+    def _handle_datagram(self, data: bytes, sender: str):
+        """
+        توجيه الرسالة حسب رأسها دون فك ترميزها
+        Dispatch a datagram by its header without decoding it
+        """
+        # صدى رسائلنا المبثوثة / Our own broadcasts looping back
+        if sender in self._local_addresses:
             return
         
-        # Heartbeat
-        if message == HEARTBEAT_MESSAGE:
-            self._handle_heartbeat(sender)
-            return
+        try:
+            split = split_header(data)
+            if split is None:
+                return
+            
+            header, offset = split
+            handler = self._dispatch.get(header)
+            if handler:
+                handler(memoryview(data)[offset:], sender)
+        except Exception as e:
+            if self.running and self.verbose:
+                print(f"{Colors.FAIL}❌ خطأ استماع: {e}{Colors.END}")
     
-    def _respond_to_discovery(self, sender: str):
+    def _respond_to_discovery(self, payload: memoryview, sender: str):
         """الرد على طلب الاكتشاف / Respond to discovery request"""
-        import platform
-        device_name = platform.node() or "Linux"
-        response = f"{DEVICE_PREFIX}Linux|{device_name}"
-        self._send_to(response, sender)
+        self._send_to(self._discovery_response, sender)
         
         if self.verbose:
             print(f"{Colors.CYAN}📡 تم الرد على اكتشاف من / Responded to discovery from: {sender}{Colors.END}")
     
-    def _handle_device_response(self, message: str, sender: str):
+    def _handle_device_response(self, payload: memoryview, sender: str):
         """معالجة رد الجهاز / Handle device response"""
         try:
-            parts = message[len(DEVICE_PREFIX):].split('|')
-            if len(parts) >= 2:
+            parsed = parse_device(bytes(payload))
+            if parsed:
                 device = Device(
                     address=sender,
-                    platform=parts[0],
-                    name=parts[1],
-                    last_seen=datetime.now()
+                    platform=parsed[0],
+                    name=parsed[1],
+                    last_seen=time.monotonic_ns()
                 )
                 self.discovered_devices[sender] = device
+                heapq.heappush(self._expiry, (device.last_seen + STALE_TIMEOUT_NS, sender))
                 print(f"{Colors.GREEN}📱 جهاز مكتشف / Device discovered: {device}{Colors.END}")
         except Exception as e:
             if self.verbose:
                 print(f"{Colors.FAIL}❌ خطأ في تحليل الجهاز: {e}{Colors.END}")
     
-    def _handle_clipboard(self, message: str, sender: str):
+    def _handle_clipboard(self, payload: memoryview, sender: str):
         """معالجة محتوى الحافظة / Handle clipboard content"""
         try:
-            base64_content = message[len(CLIPBOARD_PREFIX):]
-            content = base64.b64decode(base64_content).decode('utf-8')
+            # صدى لآخر محتوى: لا حاجة لفك الترميز / Echo of the last payload: skip decoding
+            if payload == self._last_encoded_payload:
+                return
+            
+            content = decode_clipboard(payload)
+            self._last_encoded_payload = bytes(payload)
             
-            with self.clipboard_lock:
-                if content != self.last_clipboard:
-                    self.last_clipboard = content
-                    pyperclip.copy(content)
-                    
-                    # إرسال تأكيد / Send ACK
-                    self._send_to(f"{ACK_PREFIX}RECEIVED", sender)
-                    
-                    preview = content[:50] + "..." if len(content) > 50 else content
-                    print(f"{Colors.GREEN}📋 تم استلام / Received: {preview}{Colors.END}")
+            if content != self.last_clipboard:
+                self.last_clipboard = content
+                # المحتوى الوارد أحدث من أي بث مؤجل / Incoming content supersedes a deferred broadcast
+                if self._pending_broadcast:
+                    self._pending_broadcast.cancel()
+                    self._pending_broadcast = None
+                self._spawn(self._copy_remote_clipboard(content, sender))
+        except Exception as e:
+            if self.verbose:
+                print(f"{Colors.FAIL}❌ خطأ في الحافظة: {e}{Colors.END}")
+    
+    async def _copy_remote_clipboard(self, content: str, sender: str):
+        """كتابة الحافظة الواردة / Write received clipboard"""
+        loop = asyncio.get_running_loop()
+        self._pending_copies += 1
+        try:
+            await loop.run_in_executor(self._clipboard_executor, pyperclip.copy, content)
         except Exception as e:
             if self.verbose:
                 print(f"{Colors.FAIL}❌ خطأ في الحافظة: {e}{Colors.END}")
+            return
+        finally:
+            self._pending_copies -= 1
+        
+        # إرسال تأكيد / Send ACK
+        self._send_to(ACK_RECEIVED_BYTES, sender)
+        
+        preview = content[:50] + "..." if len(content) > 50 else content
+        print(f"{Colors.GREEN}📋 تم استلام / Received: {preview}{Colors.END}")
     
-    def _handle_ack(self, message: str, sender: str):
+    def _handle_ack(self, payload: memoryview, sender: str):
         """معالجة التأكيد / Handle acknowledgment"""
-        ack_type = message[len(ACK_PREFIX):]
         if self.verbose:
+            ack_type = bytes(payload).decode('utf-8', errors='replace')
             print(f"{Colors.CYAN}✓ ACK من {sender}: {ack_type}{Colors.END}")
     
-    def _handle_heartbeat(self, sender: str):
+    def _handle_heartbeat(self, payload: memoryview, sender: str):
         """معالجة Heartbeat / Handle heartbeat"""
-        if sender in self.discovered_devices:
-            self.discovered_devices[sender].last_seen = datetime.now()
+        device = self.discovered_devices.get(sender)
+        if device:
+            device.last_seen = time.monotonic_ns()
+            heapq.heappush(self._expiry, (device.last_seen + STALE_TIMEOUT_NS, sender))
+    
+    def _start_clipboard_watcher(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """بدء مراقبة أحداث X11 / Start X11 event-driven monitoring"""
+        if not xdisplay:
+            return False
+        
+        try:
+            watcher = X11ClipboardWatcher(self._on_x11_clipboard)
+        except Exception as e:
+            if self.verbose:
+                print(f"{Colors.WARNING}⚠️ XFixes غير متاح، سيتم الاستطلاع / XFixes unavailable, polling: {e}{Colors.END}")
+            return False
+        
+        self._clipboard_watcher = watcher
+        loop.add_reader(watcher.fileno(), self._process_x11_events)
+        watcher.request_selection()
+        
+        if self.verbose:
+            print(f"{Colors.CYAN}📋 مراقبة الحافظة عبر XFixes / Watching clipboard via XFixes{Colors.END}")
+        return True
+    
+    def _process_x11_events(self):
+        """معالجة أحداث X11 / Handle X11 events"""
+        try:
+            self._clipboard_watcher.process_events()
+        except Exception as e:
+            if self.verbose:
+                print(f"{Colors.WARNING}⚠️ خطأ مراقبة الحافظة: {e}{Colors.END}")
+    
+    def _on_x11_clipboard(self, content: Optional[str]):
+        """تغيّر الحافظة محلياً عبر X11 / Local clipboard changed via X11"""
+        if content is None:
+            # محتوى كبير عبر INCR: القراءة عبر pyperclip
+            # Large INCR content: read it through pyperclip instead
+            self._spawn(self._read_clipboard_fallback())
+            return
+        self._on_local_clipboard(content)
+    
+    def _spawn(self, coro):
+        """تشغيل مهمة قصيرة وتتبعها للإيقاف / Run a short task, tracked for shutdown"""
+        self._tasks = [task for task in self._tasks if not task.done()]
+        self._tasks.append(asyncio.create_task(coro))
+    
+    async def _read_clipboard_fallback(self):
+        """قراءة الحافظة عبر pyperclip / Read clipboard through pyperclip"""
+        loop = asyncio.get_running_loop()
+        try:
+            current = await loop.run_in_executor(self._clipboard_executor, pyperclip.paste)
+            self._on_local_clipboard(current)
+        except Exception as e:
+            if self.verbose:
+                print(f"{Colors.WARNING}⚠️ خطأ مراقبة الحافظة: {e}{Colors.END}")
     
-    def _clipboard_monitor_loop(self):
+    def _on_local_clipboard(self, current: str):
+        """بث الحافظة المحلية إن تغيّرت / Broadcast local clipboard if changed"""
+        # قراءة قديمة أثناء كتابة محتوى وارد / Stale read while a received clip is being written
+        if self._pending_copies:
+            return
+        
+        if current and current != self.last_clipboard:
+            self.last_clipboard = current
+            
+            # إرسال آخر قيمة فقط بعد هدوء التغييرات / Send only the latest value once changes settle
+            if self._pending_broadcast:
+                self._pending_broadcast.cancel()
+            self._pending_broadcast = asyncio.get_running_loop().call_later(
+                BROADCAST_DEBOUNCE, self._broadcast_clipboard, current
+            )
+    
+    async def _clipboard_monitor_loop(self):
         """حلقة مراقبة الحافظة / Clipboard monitoring loop"""
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
-                current = pyperclip.paste()
-                
-                with self.clipboard_lock:
-                    if current and current != self.last_clipboard:
-                        self.last_clipboard = current
-                        self._broadcast_clipboard(current)
+                current = await loop.run_in_executor(self._clipboard_executor, pyperclip.paste)
+                self._on_local_clipboard(current)
                 
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 if self.verbose:
                     print(f"{Colors.WARNING}⚠️ خطأ مراقبة الحافظة: {e}{Colors.END}")
-                time.sleep(1)
+                await asyncio.sleep(1)
     
-    def _heartbeat_loop(self):
+    async def _heartbeat_loop(self):
         """حلقة Heartbeat / Heartbeat loop"""
         while self.running:
             try:
-                self._broadcast(HEARTBEAT_MESSAGE)
+                self._broadcast(HEARTBEAT_BYTES)
                 self._cleanup_stale_devices()
-                time.sleep(30)
+                # قد يتغير عنوان الشبكة (DHCP، Wi-Fi) / Addresses may change (DHCP, Wi-Fi)
+                self._local_addresses = self._detect_local_addresses()
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 if self.verbose:
                     print(f"{Colors.WARNING}⚠️ خطأ Heartbeat: {e}{Colors.END}")
     
     def _broadcast_clipboard(self, content: str):
         """بث الحافظة / Broadcast clipboard"""
-        encoded = base64.b64encode(content.encode('utf-8')).decode('utf-8')
-        message = f"{CLIPBOARD_PREFIX}{encoded}"
-        self._broadcast(message)
+        if content != self._last_payload[0]:
+            encoded = encode_clipboard(content)
+            self._last_payload = (content, encoded, CLIPBOARD_PREFIX_BYTES + encoded)
+        
+        # يُحدَّث مع كل بث، وليس فقط عند تغيّر الذاكرة المؤقتة
+        # Updated on every broadcast, not only on a cache miss
+        _, self._last_encoded_payload, payload = self._last_payload
+        if len(payload) > MAX_DATAGRAM_SIZE:
+            print(f"{Colors.WARNING}⚠️ المحتوى أكبر من حد UDP ولم يُرسل / Clipboard too large for one UDP datagram, not sent ({len(payload)} bytes){Colors.END}")
+            return
+        self._broadcast(payload)
         
         preview = content[:30] + "..." if len(content) > 30 else content
         print(f"{Colors.BLUE}📤 تم الإرسال / Sent: {preview}{Colors.END}")
     
-    def _broadcast(self, message: str):
+    def _broadcast(self, data: bytes):
         """البث للشبكة / Broadcast to network"""
         try:
-            data = message.encode('utf-8')
             self.socket.sendto(data, ('255.255.255.255', self.port))
         except Exception as e:
             if self.verbose:
                 print(f"{Colors.FAIL}❌ خطأ بث: {e}{Colors.END}")
     
-    def _send_to(self, message: str, address: str):
+    def _send_to(self, data: bytes, address: str):
         """إرسال لعنوان محدد / Send to specific address"""
         try:
-            data = message.encode('utf-8')
             self.socket.sendto(data, (address, self.port))
         except Exception as e:
             if self.verbose:
@@ -342,36 +797,22 @@ class NexusClipDaemon:
     
     def _cleanup_stale_devices(self):
         """تنظيف الأجهزة القديمة / Cleanup stale devices"""
-        now = datetime.now()
-        stale_timeout = 120  # ثانية
-        
-        stale_devices = [
-            addr for addr, device in self.discovered_devices.items()
-            if (now - device.last_seen).total_seconds() > stale_timeout
-        ]
+        now = time.monotonic_ns()
         
-        for addr in stale_devices:
-            device = self.discovered_devices.pop(addr, None)
-            if device:
-                print(f"{Colors.WARNING}📵 جهاز غير متصل / Device disconnected: {device.name}{Colors.END}")
+        while self._expiry and self._expiry[0][0] <= now:
+            _, addr = heapq.heappop(self._expiry)
+            device = self.discovered_devices.get(addr)
+            
+            # تم تحديثه لاحقاً، يوجد موعد أحدث في الكومة / Refreshed since; a newer deadline is queued
+            if device is None or device.last_seen + STALE_TIMEOUT_NS > now:
+                continue
+            
+            del self.discovered_devices[addr]
+            print(f"{Colors.WARNING}📵 جهاز غير متصل / Device disconnected: {device.name}{Colors.END}")
     
     def _print_banner(self):
         """طباعة البانر / Print banner"""
-        banner = f"""
-{Colors.HEADER}╔══════════════════════════════════════════════════════════╗
-║                                                          ║
-║   {Colors.CYAN}███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗{Colors.HEADER}            ║
-║   {Colors.CYAN}████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝{Colors.HEADER}            ║
-║   {Colors.CYAN}██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗{Colors.HEADER}            ║
-║   {Colors.CYAN}██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║{Colors.HEADER}            ║
-║   {Colors.CYAN}██║ ╚████║███████╗██╔╝ ██╗╚██████╔╝███████║{Colors.HEADER}            ║
-║   {Colors.CYAN}╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚══════╝{Colors.HEADER}            ║
-║                                                          ║
-║   {Colors.GREEN}NexusClip Linux Companion v1.0{Colors.HEADER}                        ║
-║   {Colors.BLUE}نظام مزامنة الحافظة / Clipboard Sync System{Colors.HEADER}            ║
-║                                                          ║
-╚══════════════════════════════════════════════════════════╝{Colors.END}
-
+        banner = f"""{_BANNER}
 {Colors.CYAN}📡 الاستماع على المنفذ / Listening on port: {self.port}{Colors.END}
 {Colors.GREEN}✓ جاهز للمزامنة / Ready for sync{Colors.END}
 {Colors.WARNING}⌨  اضغط Ctrl+C للإيقاف / Press Ctrl+C to stop{Colors.END}
@@ -391,6 +832,7 @@ def main():
 أمثلة / Examples:
     python3 nexusclip_daemon.py
     python3 nexusclip_daemon.py -p 4040 -v
+    python3 nexusclip_daemon.py --cpu 2
         """
     )
     parser.add_argument(
@@ -399,6 +841,12 @@ def main():
         default=SYNC_PORT,
         help=f'منفذ UDP (افتراضي: {SYNC_PORT}) / UDP port (default: {SYNC_PORT})'
     )
+    parser.add_argument(
+        '--cpu',
+        type=int,
+        default=None,
+        help='تثبيت الخدمة على نواة معالج (Linux) / Pin the daemon to a CPU core (Linux)'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -407,18 +855,10 @@ def main():
     
     args = parser.parse_args()
     
-    # معالجة إشارات الإيقاف / Handle stop signals
-    daemon = NexusClipDaemon(port=args.port, verbose=args.verbose)
-    
-    def signal_handler(sig, frame):
-        daemon.stop()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    daemon = NexusClipDaemon(port=args.port, verbose=args.verbose, cpu=args.cpu)
     
     # بدء الخدمة / Start service
-    daemon.start()
+    asyncio.run(daemon.run())
 
 if __name__ == '__main__':
     main()
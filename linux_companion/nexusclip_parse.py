@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NexusClip - محلل رسائل البروتوكول
+Protocol message parsing
+
+دوال تحليل الرسائل بأنواع صارمة ليمكن ترجمتها بـ mypyc
+Strictly typed parse helpers so mypyc can compile them natively
+
+البناء (اختياري) / Build (optional):
+    pip install mypy setuptools
+    python3 setup.py build_ext --inplace
+
+بدون البناء تُستخدم نسخة Python نفسها
+Without the build, this pure-Python module is imported as-is
+"""
+
+import binascii
+from typing import Optional, Tuple
+
+# أقصى طول لرأس الرسالة قبل ':' / Max header length before ':'
+MAX_HEADER_LEN = 32
+
+
+def split_header(data: bytes) -> Optional[Tuple[bytes, int]]:
+    """
+    فصل رأس الرسالة عن حمولتها
+    Split a datagram into its header and payload offset
+    """
+    sep = data.find(b':', 0, MAX_HEADER_LEN)
+    if sep == -1:
+        if len(data) > MAX_HEADER_LEN:
+            return None
+        return data, len(data)
+    return data[:sep], sep + 1
+
+
+def parse_device(payload: bytes) -> Optional[Tuple[str, str]]:
+    """تحليل '<platform>|<name>' / Parse '<platform>|<name>'"""
+    parts = payload.decode('utf-8').split('|')
+    if len(parts) < 2:
+        return None
+    return parts[0], parts[1]
+
+
+def decode_clipboard(encoded: memoryview) -> str:
+    """فك ترميز حمولة الحافظة / Decode a base64 clipboard payload"""
+    # a2b_base64 يقرأ من memoryview مباشرة دون نسخ / reads the memoryview without a copy
+    return binascii.a2b_base64(encoded).decode('utf-8')
+
+
+def encode_clipboard(content: str) -> bytes:
+    """ترميز الحافظة بـ base64 / Base64-encode clipboard content"""
+    return binascii.b2a_base64(content.encode('utf-8'), newline=False)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+بناء محلل الرسائل كامتداد أصلي عبر mypyc
+Build the message parser as a native extension with mypyc
+
+الاستخدام / Usage:
+    pip install mypy setuptools
+    python3 setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='nexusclip-parse',
+    ext_modules=mypycify(['nexusclip_parse.py']),
+)